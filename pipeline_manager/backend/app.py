@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import hashlib
 import json
 import logging
 import os
@@ -12,11 +13,13 @@ from typing import Union
 
 from flask import Flask, render_template, request
 from flask_cors import CORS
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
 from pipeline_manager_backend_communication.misc_structures import MessageType, Status  # noqa: E501
 from werkzeug.datastructures import FileStorage
 
 from pipeline_manager import frontend
+from pipeline_manager.backend.json_provider import PMJSONProvider
 from pipeline_manager.backend.state_manager import global_state_manager
 
 logging.basicConfig(level=logging.NOTSET)
@@ -29,10 +32,18 @@ app = Flask(
     static_folder=dist_path,
     template_folder=dist_path
 )
+app.json = PMJSONProvider(app)
 
 # TODO: Change it later to our application exclusively
 CORS(app)
 
+# Message types sent to the external application for supported actions
+dataflow_action_types = {
+    'validate': MessageType.VALIDATE,
+    'run': MessageType.RUN,
+    'export': MessageType.EXPORT,
+}
+
 
 @app.route('/', methods=['GET'])
 def index():
@@ -56,6 +67,9 @@ def _load_specification(
     Loads specification that is given as an arguement and then validates
     it using a saved schema.
 
+    Validation is skipped if the specification is identical to the last
+    specification that was successfully validated.
+
     Parameters
     ----------
     specification : Union[bytes, FileStorage]
@@ -69,13 +83,17 @@ def _load_specification(
         a dataflow specification. Otherwise it is an exception message.
     """
     try:
-        if isinstance(specification, bytes):
-            specification = json.loads(specification)
-        elif isinstance(specification, FileStorage):
-            specification = json.load(specification)
-
-        schema = global_state_manager.get_schema()
-        validate(instance=specification, schema=schema)
+        if isinstance(specification, FileStorage):
+            specification = specification.read()
+        digest = hashlib.sha256(specification).digest()
+        specification = app.json.loads(specification)
+
+        if digest != global_state_manager.valid_specification_digest:
+            validator = global_state_manager.get_validator()
+            error = best_match(validator.iter_errors(specification))
+            if error is not None:
+                raise error
+            global_state_manager.valid_specification_digest = digest
     except ValidationError:
         app.logger.exception('Specification is invalid')
         return False, 'Specification is invalid'
@@ -86,6 +104,50 @@ def _load_specification(
     return True, specification
 
 
+def _request_external_application(
+        message_type: MessageType,
+        data: bytes = bytes()
+        ) -> tuple[bool, tuple]:
+    """
+    Sends a message to the connected external application and waits
+    for its response.
+
+    Parameters
+    ----------
+    message_type : MessageType
+        Type of the message sent to the external application.
+    data : bytes
+        Content of the message.
+
+    Returns
+    -------
+    tuple[bool, tuple] :
+        Returns a tuple where the first element states whether the response
+        was received. If it was then the second element is a tuple of the
+        response message type and its content. Otherwise it is an error
+        message and HTTP status that should be returned by the endpoint.
+    """
+    tcp_server = global_state_manager.get_tcp_server()
+    if not tcp_server:
+        return False, ('TCP server not initialized', HTTPStatus.BAD_REQUEST)
+
+    out = tcp_server.send_message(message_type, data)
+
+    if out.status != Status.DATA_SENT:
+        return False, ('Error while sending a message to an externall aplication', HTTPStatus.BAD_REQUEST)  # noqa: E501
+
+    status = Status.NOTHING
+    while status == Status.NOTHING:
+        out = tcp_server.wait_for_message()
+        status = out.status
+
+    if status == Status.DATA_READY:
+        return True, out.data
+    if status == Status.CLIENT_DISCONNECTED:
+        return False, ('Client is disconnected', HTTPStatus.SERVICE_UNAVAILABLE)  # noqa: E501
+    return False, ('Unknown error', HTTPStatus.BAD_REQUEST)
+
+
 @app.route('/import_dataflow', methods=['POST'])
 def import_dataflow():
     """
@@ -105,30 +167,19 @@ def import_dataflow():
     HTTPStatus.SERVICE_UNAVAILABLE :
         Client was disconnected.
     """
-    tcp_server = global_state_manager.get_tcp_server()
-    if not tcp_server:
-        return 'TCP server not initialized', HTTPStatus.BAD_REQUEST
-
     dataflow = request.files['external_application_dataflow'].read()
-    out = tcp_server.send_message(MessageType.IMPORT, dataflow)
+    success, response = _request_external_application(
+        MessageType.IMPORT,
+        dataflow
+    )
+    if not success:
+        return response
 
-    if out.status != Status.DATA_SENT:
-        return 'Error while sending a message to an externall aplication', HTTPStatus.BAD_REQUEST  # noqa: E501
+    mess_type, dataflow = response
+    if mess_type != MessageType.OK:
+        return 'Invalid message type from the client', HTTPStatus.BAD_REQUEST  # noqa: E501
 
-    status = Status.NOTHING
-    while status == Status.NOTHING:
-        out = tcp_server.wait_for_message()
-        status = out.status
-
-    if status == Status.DATA_READY:
-        mess_type, dataflow = out.data
-        if mess_type != MessageType.OK:
-            return 'Invalid message type from the client', HTTPStatus.BAD_REQUEST  # noqa: E501
-
-        return json.loads(dataflow), HTTPStatus.OK
-    if status == Status.CLIENT_DISCONNECTED:
-        return 'Client is disconnected', HTTPStatus.SERVICE_UNAVAILABLE
-    return 'Unknown error', HTTPStatus.BAD_REQUEST
+    return app.json.loads(dataflow), HTTPStatus.OK
 
 
 @app.route('/load_dataflow', methods=['POST'])
@@ -148,7 +199,7 @@ def load_dataflow():
     """
     try:
         dataflow = request.files['dataflow']
-        dataflow = json.load(dataflow)
+        dataflow = app.json.load(dataflow)
     except Exception:
         app.logger.exception('Dataflow is not a valid safe')
         return 'Dataflow is not a valid safe', HTTPStatus.BAD_REQUEST
@@ -228,34 +279,21 @@ def request_specification():
     HTTPStatus.SERVICE_UNAVAILABLE :
         Client was disconnected.
     """
-    tcp_server = global_state_manager.get_tcp_server()
-
-    if not tcp_server:
-        return 'TCP server not initialized', HTTPStatus.BAD_REQUEST
-
-    out = tcp_server.send_message(MessageType.SPECIFICATION)
-
-    if out.status != Status.DATA_SENT:
-        return 'Error while sending a message to an externall aplication', HTTPStatus.BAD_REQUEST  # noqa: E501
-
-    status = Status.NOTHING
-    while status == Status.NOTHING:
-        out = tcp_server.wait_for_message()
-        status = out.status
+    success, response = _request_external_application(
+        MessageType.SPECIFICATION
+    )
+    if not success:
+        return response
 
-    if status == Status.DATA_READY:
-        mess_type, specification = out.data
-        if mess_type != MessageType.OK:
-            return 'Invalid message type from the client', HTTPStatus.BAD_REQUEST  # noqa: E501
+    mess_type, specification = response
+    if mess_type != MessageType.OK:
+        return 'Invalid message type from the client', HTTPStatus.BAD_REQUEST  # noqa: E501
 
-        success, specification = _load_specification(specification)
+    success, specification = _load_specification(specification)
 
-        if success:
-            return specification, HTTPStatus.OK
-        return specification, HTTPStatus.BAD_REQUEST
-    if status == Status.CLIENT_DISCONNECTED:
-        return 'Client is disconnected', HTTPStatus.SERVICE_UNAVAILABLE
-    return 'Unknown error', HTTPStatus.BAD_REQUEST
+    if success:
+        return specification, HTTPStatus.OK
+    return specification, HTTPStatus.BAD_REQUEST
 
 
 @app.route('/dataflow_action_request/<request_type>', methods=['POST'])
@@ -282,47 +320,23 @@ def dataflow_action_request(request_type: str):
         Client was disconnected.
     """
     dataflow = request.form.get('dataflow')
-    tcp_server = global_state_manager.get_tcp_server()
 
-    if not tcp_server:
-        return 'TCP server not initialized', HTTPStatus.BAD_REQUEST
-
-    if request_type == 'validate':
-        out = tcp_server.send_message(
-            MessageType.VALIDATE,
-            dataflow.encode(encoding='UTF-8')
-        )
-    elif request_type == 'run':
-        out = tcp_server.send_message(
-            MessageType.RUN,
-            dataflow.encode(encoding='UTF-8')
-        )
-    elif request_type == 'export':
-        out = tcp_server.send_message(
-            MessageType.EXPORT,
-            dataflow.encode(encoding='UTF')
-        )
-    else:
+    message_type = dataflow_action_types.get(request_type)
+    if message_type is None:
         return 'No request type specified', HTTPStatus.BAD_REQUEST
 
-    if out.status != Status.DATA_SENT:
-        return 'Error while sending a message to an externall aplication', HTTPStatus.BAD_REQUEST  # noqa: E501
-
-    status = Status.NOTHING
-    while status == Status.NOTHING:
-        out = tcp_server.wait_for_message()
-        status = out.status
-
-    if status == Status.DATA_READY:
-        mess_type, message = out.data
-
-        if mess_type == MessageType.OK:
-            return message, HTTPStatus.OK
-        if mess_type == MessageType.ERROR:
-            return message, HTTPStatus.BAD_REQUEST
-
-    if status == Status.CLIENT_DISCONNECTED:
-        return 'Client is disconnected', HTTPStatus.SERVICE_UNAVAILABLE
+    success, response = _request_external_application(
+        message_type,
+        dataflow.encode(encoding='UTF-8')
+    )
+    if not success:
+        return response
+
+    mess_type, message = response
+    if mess_type == MessageType.OK:
+        return message, HTTPStatus.OK
+    if mess_type == MessageType.ERROR:
+        return message, HTTPStatus.BAD_REQUEST
     return 'Unknown error', HTTPStatus.BAD_REQUEST
 
 
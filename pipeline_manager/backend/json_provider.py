@@ -0,0 +1,77 @@
+# Copyright (c) 2022-2023 Antmicro <www.antmicro.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class PMJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider used by the backend to (de)serialize JSON data.
+
+    Dataflow specifications can contain thousands of nodes, so encoding
+    them with the pure-Python encoder of the standard `json` module
+    dominates the response time. If `orjson` is installed it is used
+    instead, both for encoding responses and decoding request data.
+    Otherwise the provider falls back to the default behaviour.
+    """
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serializes given object to a JSON string.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to serialize.
+        kwargs : Any
+            Arguments of `json.dumps`. Only `indent` and `separators`
+            are supported by `orjson`, for any other argument the
+            standard `json` module is used.
+
+        Returns
+        -------
+        str
+            Serialized object.
+        """
+        if orjson is None or not kwargs.keys() <= {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+
+        option = (
+            orjson.OPT_NON_STR_KEYS |
+            orjson.OPT_PASSTHROUGH_DATACLASS |
+            orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserializes given JSON document.
+
+        Parameters
+        ----------
+        s : Union[str, bytes]
+            JSON document. When `orjson` is used, bytes have to be
+            UTF-8 encoded.
+        kwargs : Any
+            Arguments of `json.loads`. If any is given, the standard
+            `json` module is used.
+
+        Returns
+        -------
+        Any
+            Deserialized object.
+        """
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -5,6 +5,8 @@
 import json
 from importlib.resources import open_text
 
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from pipeline_manager_backend_communication.communication_backend import CommunicationBackend  # noqa: E501
 
 from pipeline_manager.resources import schemas
@@ -40,6 +42,9 @@ class PMStateManager:
 
         self.schema = None
         self.schema_filename = 'dataflow_spec_schema.json'
+        self.validator = None
+        # SHA-256 digest of the last specification that passed validation
+        self.valid_specification_digest = None
 
     def reinitialize(
             self,
@@ -61,7 +66,7 @@ class PMStateManager:
         self.tcp_server_port = tcp_server_port
         self.tcp_server_host = tcp_server_host
 
-        if self.server:
+        if self.server is not None:
             self.server.disconnect()
         self.server = None
 
@@ -74,7 +79,7 @@ class PMStateManager:
         CommunicationBackend
             Initialied CommunicationBackend
         """
-        if not self.server:
+        if self.server is None:
             self.server = CommunicationBackend(
                 self.tcp_server_host,
                 self.tcp_server_port
@@ -90,7 +95,7 @@ class PMStateManager:
         dict
             Dataflow specification schema
         """
-        if not self.schema:
+        if self.schema is None:
             with open_text(
                 schemas,
                 self.schema_filename
@@ -98,6 +103,25 @@ class PMStateManager:
                 self.schema = json.load(f)
         return self.schema
 
+    def get_validator(self) -> Validator:
+        """
+        Returns validator of the dataflow specification schema
+
+        The schema is checked against its metaschema only once, when
+        the validator is created.
+
+        Returns
+        -------
+        Validator
+            Validator of the dataflow specification schema
+        """
+        if self.validator is None:
+            schema = self.get_schema()
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            self.validator = validator_class(schema)
+        return self.validator
+
 
 # Singleton-like object that should be imported
 global_state_manager = PMStateManager()